@@ -2,12 +2,12 @@
 PDF Word Frequency Counter
 
 A tool to search PDF files for specific words and generate frequency statistics.
-Supports both PyPDF2 and pdfminer.six backends, with output to Astropy or Pandas formats.
+Supports PyMuPDF, PyPDF2 and pdfminer.six backends, with output to Astropy or Pandas formats.
 
 Features:
 - Case-sensitive/insensitive word search
 - Unicode text normalization
-- Multi-threaded processing
+- Multi-process (or multi-threaded) processing
 - Page-range selection
 
 Example usage:
@@ -10,11 +10,22 @@ import sys
 from typing import List, Sequence
 
 from . import version, output
+from .pdf_utils import DEFAULT_PDF_BACKEND, PDF_BACKENDS
 from .search import search_pdfs
 from .utils import parse_page_range
 
 
 # ---------------------------------------------------------------------
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 def _parse_cli() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         prog="pdf-word-counter",
@@ -29,17 +40,29 @@ def _parse_cli() -> argparse.Namespace:
     # Search behaviour -------------------------------------------------
     s = p.add_argument_group("Search options")
     s.add_argument("--case", action="store_true", help="Case-sensitive search")
+    s.add_argument("--literal", action="store_true",
+                   help="Match words as plain text, not regular expressions")
     s.add_argument("--pages", help="Pages to include, e.g. '1,3-5'")
-    s.add_argument("--miner", action="store_true", help="Use pdfminer.six backend")
+    s.add_argument("--backend-pdf", choices=PDF_BACKENDS, default=DEFAULT_PDF_BACKEND,
+                   help="PDF text-extraction backend")
+    s.add_argument("--miner", action="store_true",
+                   help="Use pdfminer.six backend (same as --backend-pdf pdfminer)")
     s.add_argument("--pprint", type=int, metavar="N",
-                   help="Progress log every N pages (PyPDF2 only)")
-    s.add_argument("--unicode", action="store_true", help="Normalise Unicode text")
+                   help="Progress log every N pages")
+    s.add_argument("--max-hits", type=_positive_int, metavar="N",
+                   help="Stop reading a PDF once the words have N matches in total")
+    s.add_argument("--unicode", action="store_true",
+                   help="Normalise Unicode in search words (and in the PDF text when a "
+                        "word is non-ASCII)")
+    s.add_argument("--unicode-text", action="store_true",
+                   help="Also normalise the PDF text (slower; implies --unicode)")
     s.add_argument("--form", choices=["NFC", "NFD", "NFKC", "NFKD"],
                    default="NFKC", help="Unicode normalisation form")
 
     # Output / formatting ----------------------------------------------
     o = p.add_argument_group("Output control")
-    o.add_argument("--outfile", help="Write output table to this file")
+    o.add_argument("--outfile", help="Write output table to this file (written row by "
+                   "row in constant memory with --backend pandas, unless --show/--sort)")
     o.add_argument("--show", action="store_true", help="Print table to stdout")
     o.add_argument("--sort", help="Sort by these columns (comma-separated)")
 
@@ -57,7 +80,15 @@ def _parse_cli() -> argparse.Namespace:
                    dest="include_pages", help="Omit pages column")
 
     # Performance -------------------------------------------------------
-    p.add_argument("--workers", type=int, default=1, help="Thread workers")
+    p.add_argument("--workers", type=int, default=1, help="Parallel workers")
+    p.add_argument("--executor", choices=["process", "thread"], default="process",
+                   help="Worker pool type used when --workers > 1")
+    p.add_argument("--page-workers", type=int, default=1, metavar="N",
+                   help="Worker processes per PDF for page extraction (PyMuPDF only)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Do not cache extracted text on disk")
+    p.add_argument("--cache-dir", help="Extracted-text cache directory "
+                   "(default: $XDG_CACHE_HOME/pdf-word-counter)")
     p.add_argument("--backend", choices=["pandas", "astropy"],
                    help="Force output backend")
     p.add_argument("--ppdf", type=int, metavar="N",
@@ -101,18 +132,27 @@ def main(cli_args: Sequence[str] | None = None) -> None:
         show=args.show,
         sort_cols=sort_cols,
         workers=args.workers,
+        executor=args.executor,
         ppdf=args.ppdf,
         ignore_case=not args.case,
+        literal=args.literal,
         pages=pages,
         use_pdfminer=args.miner,
+        pdf_backend=args.backend_pdf,
+        page_workers=args.page_workers,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
         include_pages=args.include_pages,
         include_filename=not args.nfile,
         keep_extension=args.ext,
         separators=separators,
         include_year=args.year,
         normalise_unicode=args.unicode,
+        normalise_text=args.unicode_text,
         unicode_form=args.form,
         progress_interval=args.pprint,
+        max_hits=args.max_hits,
+        return_table=False,
     )
 
 
@@ -3,13 +3,35 @@ Backend-agnostic helpers: choose Astropy or pandas at runtime.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Sequence
+import csv
+import os
+import tempfile
+from typing import Any, Callable, Dict, Iterable, Sequence
 
 _BACKEND = "astropy"  # default
 _funcs: Dict[str, Any] = {}  # populated by `load_backend`
 
+# Public API, bound to the selected backend's functions by `load_backend`
+make_table: Callable[..., Any]
+make_final_table: Callable[..., Any]
+stack_tables: Callable[..., Any]
+sort_table: Callable[..., Any]
+write_table: Callable[..., Any]
+write_rows: Callable[..., None]
+
+
+def _target_mode(path: str) -> int:
+    """Permission bits *path* keeps, or gets as a new file under the umask."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
 
 def load_backend(name: str | None = None) -> None:  # noqa: C901  (intentional branching)
+    """Select the Astropy or pandas backend and rebind this module's table functions."""
     global _BACKEND, _funcs
 
     if name != "pandas":
@@ -21,6 +43,13 @@ def load_backend(name: str | None = None) -> None:  # noqa: C901  (intentional b
             def make_table(data: Dict[str, Iterable]) -> Table:  # type: ignore
                 return Table({k: list(v) for k, v in data.items()})
 
+            def make_final_table(rows, word_cols):  # type: ignore
+                names = list(rows[0])
+                dtype = ["i8" if c in word_cols else "i4" if c == "pages" else None
+                         for c in names]
+                return Table(rows=[[r[c] for c in names] for r in rows],
+                             names=names, dtype=dtype)
+
             def stack_tables(tbls):  # type: ignore
                 return vstack(tbls, metadata_conflicts="silent")
 
@@ -32,10 +61,18 @@ def load_backend(name: str | None = None) -> None:  # noqa: C901  (intentional b
                 tbl.write(path, format="ascii.fixed_width", bookend=False,
                           delimiter=",", overwrite=True)
 
+            def write_rows(rows, path, word_cols=()):  # type: ignore
+                # Fixed-width columns need every row before the first line, so
+                # this buffers the whole run; only the pandas backend streams
+                write_table(make_final_table(list(rows), word_cols), path)
+
             _funcs = dict(make_table=make_table,
+                          make_final_table=make_final_table,
                           stack_tables=stack_tables,
                           sort_table=sort_table,
-                          write_table=write_table)
+                          write_table=write_table,
+                          write_rows=write_rows)
+            globals().update(_funcs)
             return
         except ImportError:
             if name == "astropy":
@@ -47,6 +84,15 @@ def load_backend(name: str | None = None) -> None:  # noqa: C901  (intentional b
     def make_table(data: Dict[str, Iterable]) -> pd.DataFrame:  # type: ignore
         return pd.DataFrame(data)
 
+    def make_final_table(rows, word_cols):  # type: ignore
+        df = pd.DataFrame.from_records(rows)
+        df[list(word_cols)] = df[list(word_cols)].astype("int64")
+        if "pages" in df.columns:
+            df["pages"] = df["pages"].astype("int32")
+        if "file" in df.columns:
+            df["file"] = df["file"].astype("string[python]")
+        return df
+
     def stack_tables(tbls):  # type: ignore
         return pd.concat(tbls, ignore_index=True)
 
@@ -56,19 +102,40 @@ def load_backend(name: str | None = None) -> None:  # noqa: C901  (intentional b
     def write_table(tbl, path):  # type: ignore
         tbl.to_csv(path, index=False)
 
+    def write_rows(rows, path, word_cols=()):  # type: ignore
+        # Same layout as ``to_csv``, one line per row as it arrives; rows go to
+        # a temporary file that only replaces *path* once every PDF is done
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                   prefix=".pdf-word-counter-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", newline="") as fh:
+                writer = None
+                for row in rows:
+                    if writer is None:
+                        writer = csv.DictWriter(fh, fieldnames=list(row),
+                                                lineterminator=os.linesep)
+                        writer.writeheader()
+                    writer.writerow(row)
+            os.chmod(tmp, _target_mode(path))  # mkstemp creates the file as 0600
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
     _funcs = dict(make_table=make_table,
+                  make_final_table=make_final_table,
                   stack_tables=stack_tables,
                   sort_table=sort_table,
-                  write_table=write_table)
+                  write_table=write_table,
+                  write_rows=write_rows)
+    globals().update(_funcs)
 
 
-# Initialise with default backend when module is imported
+# Initialise with default backend when module is imported; this binds the
+# functions listed in ``__all__`` as module attributes (no per-call indirection).
+# Use ``output.make_table`` rather than ``from output import make_table`` to
+# pick up a later ``load_backend`` switch.
 load_backend()
 
-# Public re-exports ----------------------------------------------------
-make_table = lambda *a, **k: _funcs["make_table"](*a, **k)
-stack_tables = lambda *a, **k: _funcs["stack_tables"](*a, **k)
-sort_table = lambda *a, **k: _funcs["sort_table"](*a, **k)
-write_table = lambda *a, **k: _funcs["write_table"](*a, **k)
-__all__ = ["load_backend", "make_table", "stack_tables", "sort_table", "write_table"]
-
+__all__ = ["load_backend", "make_table", "make_final_table", "stack_tables", "sort_table",
+           "write_table", "write_rows"]
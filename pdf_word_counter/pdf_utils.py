@@ -1,22 +1,74 @@
 """
-Wrapper functions around PyPDF2 and pdfminer.six for text extraction.
+Wrapper functions around PyMuPDF, PyPDF2 and pdfminer.six for text extraction.
 """
 from __future__ import annotations
 
+import concurrent.futures as cf
+import hashlib
 import io
+import math
+import os
+import pickle
+import tempfile
+import time
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 import PyPDF2
 
 try:
-    from pdfminer.high_level import extract_text, extract_text_to_fp
+    import pymupdf
+except ImportError:  # pragma: no cover
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24
+    except ImportError:
+        pymupdf = None
+
+HAS_PYMUPDF = pymupdf is not None  # PyMuPDF is optional, but much faster
+
+try:
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
     from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
 
     HAS_PDFMINER = True
+
+    class _TextOnlyInterpreter(PDFPageInterpreter):
+        """
+        Page interpreter that ignores operators which cannot produce text.
+
+        Path construction/painting, clipping, colour and shading operators are
+        still tokenised but no longer build layout objects, which dominates
+        the cost of graphics-heavy pages (plots, diagrams). Text positioning
+        (``cm``, ``q``/``Q``, ``T*`` ...), text showing and XObjects are kept.
+        """
+
+        def _skip(self, *args: object) -> None:
+            # No named parameters, so pdfminer pops no operands; drop them here
+            self.argstack = []
+
+        do_m = do_l = do_c = do_v = do_y = do_h = do_re = _skip  # type: ignore[assignment]
+        do_S = do_s = do_f = do_F = do_f_a = do_B = do_B_a = do_b = do_b_a = do_n = _skip
+        do_W = do_W_a = do_sh = _skip  # type: ignore[assignment]
+        do_G = do_g = do_RG = do_rg = do_K = do_k = _skip  # type: ignore[assignment]
+        do_SC = do_SCN = do_sc = do_scn = _skip
+
 except ImportError:  # pragma: no cover
     HAS_PDFMINER = False  # pdfminer is strictly optional
 
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:  # pragma: no cover
+    HAS_ZSTD = False  # cache entries are stored uncompressed
+
+PDF_BACKENDS = ("pymupdf", "pypdf2", "pdfminer")
+DEFAULT_PDF_BACKEND = "pymupdf" if HAS_PYMUPDF else "pypdf2"
+
 
 def count_pages_with_pdfminer(pdf_path: str) -> int:
     """Count the number of pages in a PDF using pdfminer."""
@@ -24,6 +76,37 @@ def count_pages_with_pdfminer(pdf_path: str) -> int:
         return sum(1 for _ in PDFPage.get_pages(f))
 
 
+def _pymupdf_pages(pdf: str, page_numbers: Sequence[int]) -> List[str]:
+    """Extract *page_numbers* from *pdf* with a private PyMuPDF document handle."""
+    with pymupdf.open(pdf) as doc:
+        return [doc.load_page(p).get_text("text") for p in page_numbers]
+
+
+def extract_with_pymupdf(
+    pdf: str | Path, page_numbers: Sequence[int] | None = None, workers: int = 1
+) -> List[str]:
+    """
+    Return a list of page texts using PyMuPDF (MuPDF C library).
+
+    With ``workers > 1`` the pages are split into contiguous chunks extracted
+    by separate processes; MuPDF is not thread-safe, so every worker opens
+    its own copy of the document.
+    """
+    if not HAS_PYMUPDF:  # pragma: no cover
+        raise RuntimeError("PyMuPDF not installed")
+
+    with pymupdf.open(str(pdf)) as doc:
+        pages = list(range(doc.page_count) if page_numbers is None else page_numbers)
+        if workers <= 1 or len(pages) < 2:
+            return [doc.load_page(p).get_text("text") for p in pages]
+
+    size = math.ceil(len(pages) / workers)
+    chunks = [pages[i:i + size] for i in range(0, len(pages), size)]
+    with cf.ProcessPoolExecutor(max_workers=len(chunks)) as ex:
+        results = ex.map(_pymupdf_pages, [str(pdf)] * len(chunks), chunks)
+        return [txt for chunk in results for txt in chunk]
+
+
 def extract_with_pypdf2(pdf: str | Path, page_numbers: Sequence[int] | None = None) -> List[str]:
     """Return a list of page texts using PyPDF2."""
     reader = PyPDF2.PdfReader(str(pdf), strict=False)
@@ -31,20 +114,141 @@ def extract_with_pypdf2(pdf: str | Path, page_numbers: Sequence[int] | None = No
     return [reader.pages[p].extract_text() or "" for p in pages]
 
 
-def extract_with_pdfminer(pdf: str | Path, page_numbers: Sequence[int] | None = None) -> str:
-    """Return concatenated text of selected pages (or whole doc) via pdfminer.six."""
+def _iter_pdfminer(
+    pdf: str | Path, page_numbers: Sequence[int] | None = None
+) -> Tuple[int, Iterator[str]]:
+    """Return the page count of *pdf* and a lazy iterator over the selected page texts."""
     if not HAS_PDFMINER:  # pragma: no cover
         raise RuntimeError("pdfminer.six not installed")
 
-    if page_numbers is None:
-        return extract_text(str(pdf))  # type: ignore[arg-type]
+    fh = open(pdf, "rb")
+    try:
+        all_pages = list(PDFPage.create_pages(PDFDocument(PDFParser(fh))))
+        n = len(all_pages)
+        # Pages past the end are skipped (not an error), as in pdfminer itself
+        selected = all_pages if page_numbers is None else [
+            all_pages[p] for p in page_numbers if -n <= p < n]
+    except Exception:
+        fh.close()
+        raise
+
+    def texts() -> Iterator[str]:
+        rsrcmgr = PDFResourceManager(caching=True)
+        buf = io.StringIO()
+        device = TextConverter(rsrcmgr, buf, laparams=LAParams())
+        try:
+            interp = _TextOnlyInterpreter(rsrcmgr, device)
+            for page in selected:
+                interp.process_page(page)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+        finally:
+            device.close()
+            fh.close()
+
+    return len(all_pages), texts()
+
+
+def extract_with_pdfminer(
+    pdf: str | Path, page_numbers: Sequence[int] | None = None
+) -> Tuple[List[str], int]:
+    """
+    Return ``(page_texts, n_pages)`` via pdfminer.six: the text of each selected
+    page (or every page) and the document's page count.
+
+    The document is parsed once and all pages go through a single
+    interpreter/converter pair whose output buffer is emptied after each page;
+    graphics operators are skipped (see :class:`_TextOnlyInterpreter`).
+    """
+    n_pages, texts = _iter_pdfminer(pdf, page_numbers)
+    return list(texts), n_pages
+
+
+def extract_pages(pdf: str | Path, page_numbers: Sequence[int] | None = None,
+                  backend: str = DEFAULT_PDF_BACKEND, workers: int = 1):
+    """Dispatch to the extractor of *backend* (pdfminer returns ``(page_texts, n_pages)``)."""
+    if backend == "pymupdf":
+        return extract_with_pymupdf(pdf, page_numbers, workers=workers)
+    if backend == "pdfminer":
+        return extract_with_pdfminer(pdf, page_numbers)
+    return extract_with_pypdf2(pdf, page_numbers)
+
+
+def iter_pages(pdf: str | Path, page_numbers: Sequence[int] | None = None,
+               backend: str = DEFAULT_PDF_BACKEND) -> Tuple[int, Iterator[str]]:
+    """
+    Return ``(n_pages, texts)`` where *texts* extracts the pages lazily, so
+    callers can stop early; *n_pages* matches what :pyfunc:`extract_pages`
+    reports (selected pages, or the whole document for pdfminer).
+    """
+    if backend == "pdfminer":
+        return _iter_pdfminer(pdf, page_numbers)
+    if backend == "pymupdf":
+        doc = pymupdf.open(str(pdf))
+        pages = range(doc.page_count) if page_numbers is None else page_numbers
+
+        def texts() -> Iterator[str]:
+            try:
+                for p in pages:
+                    yield doc.load_page(p).get_text("text")
+            finally:
+                doc.close()
+
+        return len(pages), texts()
+    reader = PyPDF2.PdfReader(str(pdf), strict=False)
+    pages = range(len(reader.pages)) if page_numbers is None else page_numbers
+    return len(pages), (reader.pages[p].extract_text() or "" for p in pages)
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/pdf-word-counter`` (``~/.cache`` if unset)."""
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "pdf-word-counter"
+
+
+_CACHE_FORMAT = 3  # bump when an extractor's return value changes
+
+
+def cached_extract(pdf: str | Path, page_numbers: Sequence[int] | None = None,
+                   backend: str = DEFAULT_PDF_BACKEND, *, workers: int = 1,
+                   cache_dir: str | Path | None = None, min_seconds: float = 0.1):
+    """
+    :pyfunc:`extract_pages` memoised on disk.
+
+    Entries are keyed by path, modification time, size, page selection and
+    *backend*, so editing a PDF invalidates them. Extractions that took less
+    than *min_seconds* are not stored, to keep tiny files out of the cache.
+    """
+    path = Path(pdf).resolve()
+    st = path.stat()
+    pages = None if page_numbers is None else list(page_numbers)
+    key = hashlib.blake2b(
+        f"{_CACHE_FORMAT}|{path}|{st.st_mtime_ns}|{st.st_size}|{pages}|{backend}".encode()
+    ).hexdigest()
+    suffix = ".pkl.zst" if HAS_ZSTD else ".pkl"
+    entry = Path(cache_dir or default_cache_dir()) / key[:2] / f"{key}{suffix}"
 
-    text_chunks: List[str] = []
-    with open(pdf, "rb") as fh:
-        for page in page_numbers:
-            buf = io.StringIO()
-            extract_text_to_fp(fh, buf, page_numbers=[page])  # type: ignore[arg-type]
-            text_chunks.append(buf.getvalue())
-            fh.seek(0)
-    return "".join(text_chunks)
+    if entry.is_file():
+        try:
+            data = entry.read_bytes()
+            return pickle.loads(zstandard.decompress(data) if HAS_ZSTD else data)
+        except Exception:  # corrupt / truncated entry: extract again
+            pass
 
+    t0 = time.perf_counter()
+    result = extract_pages(path, page_numbers, backend, workers=workers)
+    if time.perf_counter() - t0 >= min_seconds:
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer (process or thread), then an atomic rename
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, prefix=f".{entry.name}.",
+                                   suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(zstandard.compress(data) if HAS_ZSTD else data)
+            os.replace(tmp, entry)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return result
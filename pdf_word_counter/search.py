@@ -8,6 +8,7 @@ import logging
 import math
 import unicodedata
 from collections import OrderedDict
+from functools import partial
 from glob import glob
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence
@@ -16,22 +17,42 @@ from tqdm import tqdm
 
 from . import output as _out
 from .pdf_utils import (
-    count_pages_with_pdfminer,
-    extract_with_pdfminer,
-    extract_with_pypdf2,
+    cached_extract,
+    extract_pages,
+    iter_pages,
+    DEFAULT_PDF_BACKEND,
     HAS_PDFMINER,
+    HAS_PYMUPDF,
 )
-from .utils import apply_separators, compile_words, dict_to_lists, find_year
+from .utils import apply_separators, compile_words, find_year
 
 log = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------
+def maybe_normalize(txt: str, form: str) -> str:
+    """
+    Return *txt* in Unicode normalisation *form*, skipping the copy when possible.
+
+    ASCII is invariant under every form and Latin-1 under NFC; otherwise the
+    C-level quick check (:pyfunc:`unicodedata.is_normalized`) runs first.
+    """
+    if txt.isascii():
+        return txt
+    if form == "NFC" and max(txt) < "\u0100":
+        return txt
+    if unicodedata.is_normalized(form, txt):
+        return txt
+    return unicodedata.normalize(form, txt)
+
+
 # ---------------------------------------------------------------------
 def search_pdf(
     pdf: str | Path,
     words: Sequence[str],
     *,
     ignore_case: bool = True,
+    literal: bool = False,
     pages: Sequence[int] | None = None,
     include_pages: bool = True,
     include_year: bool = False,
@@ -40,64 +61,123 @@ def search_pdf(
     keep_extension: bool = False,
     separators: Dict[str, Dict[str, int]] | None = None,
     progress_interval: int | None = None,
+    max_hits: int | None = None,
     use_pdfminer: bool = False,
+    pdf_backend: str | None = None,
+    page_workers: int = 1,
+    use_cache: bool = False,
+    cache_dir: str | Path | None = None,
     normalise_unicode: bool = False,
+    normalise_text: bool = False,
     unicode_form: str = "NFKC",
 ):
     """
-    Search *pdf* for *words* and return a one-row Astropy Table or pandas DataFrame.
+    Search *pdf* for *words* and return the result row as an ``OrderedDict``
+    (column name -> value); :pyfunc:`search_pdfs` turns rows into a table.
+
+    Words are regular expressions unless ``literal=True``, in which case they
+    are matched as plain text (e.g. ``"C++"``).
+
+    *pdf_backend* is one of ``"pymupdf"``, ``"pypdf2"`` or ``"pdfminer"``
+    (default: PyMuPDF when installed); ``use_pdfminer=True`` is kept as an
+    alias for ``pdf_backend="pdfminer"``. With PyMuPDF, ``page_workers > 1``
+    extracts the pages of this one PDF in parallel processes.
+
+    With *max_hits*, pages are extracted one at a time and the search stops
+    once the words have that many matches in total (the counts are then lower
+    bounds); this bypasses the cache and ``page_workers``.
+
+    ``use_cache=True`` memoises the extracted text on disk (see
+    :pyfunc:`~pdf_word_counter.pdf_utils.cached_extract`), so repeated runs
+    with other words skip the extraction.
+
+    ``normalise_unicode`` normalises the query *words* to *unicode_form*. The
+    page text is left alone while every normalised word is ASCII; otherwise
+    (e.g. ``"café"``, which the PDF may spell with a combining accent) it is
+    normalised as well. ``normalise_text`` always normalises the page text,
+    which is needed when the PDF itself holds compatibility characters (e.g.
+    the ``\ufb01`` ligature under NFKC) but costs a copy of every page.
     """
     pdf = Path(pdf)
+    if use_pdfminer:
+        pdf_backend = "pdfminer"
+    pdf_backend = pdf_backend or DEFAULT_PDF_BACKEND
+    if (pdf_backend == "pdfminer" and not HAS_PDFMINER
+            or pdf_backend == "pymupdf" and not HAS_PYMUPDF):
+        pdf_backend = "pypdf2"
     flags = 0 if ignore_case else 0
     if ignore_case:
         import re
 
         flags = re.IGNORECASE
-    regexes = compile_words(words, flags)
+    if normalise_text:
+        normalise_unicode = True
+    elif normalise_unicode:
+        # Only ASCII words match unnormalised text the same as normalised text
+        normalise_text = not all(maybe_normalize(w, unicode_form).isascii() for w in words)
+    count_words = compile_words(words, flags, unicode_form if normalise_unicode else None,
+                                literal=literal)
 
     fname_full = pdf.name
     fname = fname_full if keep_extension else pdf.stem
 
     # Result row -------------------------------------------------------
-    row: Dict[str, Iterable] = OrderedDict()
+    row: Dict[str, str | int | None] = OrderedDict()
     if include_filename:
         row["file"] = fname
     if include_year:
         row["year"] = find_year(fname_full, default_year)
     if separators:
+        # Every row carries every column, even if *fname* has too few parts
+        row.update((col, None) for cols in separators.values() for col in cols)
         row.update(apply_separators(fname_full if keep_extension else fname, separators))
     if include_pages:
         row["pages"] = 0
 
-    for w in words:
+    uniq_words = list(dict.fromkeys(words))
+    for w in uniq_words:
         row[w] = 0
 
-    # Choose extraction backend ---------------------------------------
-    if use_pdfminer and HAS_PDFMINER:
-        if include_pages:
-            row["pages"] = count_pages_with_pdfminer(str(pdf)) 
-        text = extract_with_pdfminer(str(pdf), pages)
-        if normalise_unicode:
-            text = unicodedata.normalize(unicode_form, text)
-        for w, pat in regexes.items():
-            row[w] = len(pat.findall(text))
-        return _out.make_table(dict_to_lists(row))
+    # Extract text (optionally through the on-disk cache) --------------
+    page_texts: Iterable[str]  # lazy with max_hits, a list otherwise
+    if max_hits is not None:
+        n_pages, page_texts = iter_pages(pdf, pages, pdf_backend)
+    else:
+        if use_cache:
+            extracted = cached_extract(pdf, pages, pdf_backend, workers=page_workers,
+                                       cache_dir=cache_dir)
+        else:
+            extracted = extract_pages(pdf, pages, pdf_backend, workers=page_workers)
 
-    # Fallback to PyPDF2 (page by page) -------------------------------
-    page_texts = extract_with_pypdf2(str(pdf), pages)
+        if pdf_backend == "pdfminer":
+            page_texts, n_pages = extracted  # pdfminer reports the whole document
+        else:
+            page_texts, n_pages = extracted, len(extracted)
 
     if include_pages:
-        row["pages"] = len(page_texts) if pages is None else len(pages)
+        row["pages"] = n_pages
 
-    for i, txt in enumerate(page_texts, 1):
-        if progress_interval and i % progress_interval == 0:
-            log.info("[%s] page %d/%d", fname, i, len(page_texts))
-        if normalise_unicode:
-            txt = unicodedata.normalize(unicode_form, txt)
-        for w, pat in regexes.items():
-            row[w] += len(pat.findall(txt))
+    counts = [0] * len(uniq_words)
+    if progress_interval or max_hits is not None:
+        n_selected = n_pages if pages is None else len(pages)
+        for i, txt in enumerate(page_texts, 1):
+            if progress_interval and i % progress_interval == 0:
+                log.info("[%s] page %d/%d", fname, i, n_selected)
+            if normalise_text:
+                txt = maybe_normalize(txt, unicode_form)
+            count_words([txt], counts)
+            if max_hits is not None and sum(counts) >= max_hits:
+                break
+    else:
+        # Literal words: one scan per document instead of per page
+        if normalise_text:
+            texts = [maybe_normalize(txt, unicode_form) for txt in page_texts]
+        else:
+            texts = list(page_texts)
+        count_words(texts, counts)
+    row.update(zip(uniq_words, counts))
 
-    return _out.make_table(dict_to_lists(row))
+    return row
 
 
 # ---------------------------------------------------------------------
@@ -109,12 +189,23 @@ def search_pdfs(
     show: bool = False,
     sort_cols: Sequence[str] | None = None,
     workers: int = 1,
+    executor: str = "process",
     ppdf: int | None = None,
     tqdm_desc: str = "PDFs",
+    return_table: bool = True,
     **kwargs,
 ):
     """
-    Wrapper over :pyfunc:`search_pdf` for many files (serial or threaded).
+    Wrapper over :pyfunc:`search_pdf` for many files (serial or parallel).
+
+    With ``workers > 1`` files are spread over a pool of worker processes
+    (``executor="process"``) or threads (``executor="thread"``). Text
+    extraction is pure Python for PyPDF2/pdfminer (GIL-bound) and PyMuPDF
+    is not thread-safe, so processes are the default.
+
+    With ``return_table=False`` and an *outfile* but no *show*/*sort_cols*,
+    rows are written to *outfile* as each PDF finishes (constant memory with
+    the pandas backend) and ``None`` is returned.
     """
     if isinstance(pdfs, str):
         pdfs = glob(pdfs) if "*" in pdfs else [pdfs]
@@ -123,30 +214,17 @@ def search_pdfs(
     if not pdfs:
         raise FileNotFoundError("No PDF files matched the given pattern(s).")
 
-    tables = []
+    rows = _iter_rows(pdfs, words, workers, executor, ppdf, tqdm_desc, kwargs)
+    word_cols = list(dict.fromkeys(words))
 
-    # Threaded branch --------------------------------------------------
-    if workers > 1:
-        with cf.ThreadPoolExecutor(max_workers=workers) as ex, tqdm(
-            total=len(pdfs), desc=tqdm_desc, unit="pdf", ascii=True
-        ) as bar:
-            futs = {ex.submit(search_pdf, pdf, words, **kwargs): pdf for pdf in pdfs}
-            for fut in cf.as_completed(futs):
-                tables.append(fut.result())
-                bar.update(1)
-    # Serial branch ----------------------------------------------------
-    else:
-        if ppdf:
-            stride = max(1, math.ceil(len(pdfs) / ppdf))
-            for i, pdf in enumerate(pdfs, 1):
-                if (i - 1) % stride == 0:
-                    log.info("%02d/%02d [%s]", i, len(pdfs), Path(pdf).name)
-                tables.append(search_pdf(pdf, words, **kwargs))
-        else:
-            for pdf in tqdm(pdfs, desc=tqdm_desc, unit="pdf", ascii=True):
-                tables.append(search_pdf(pdf, words, **kwargs))
+    # Nothing to sort or print: write rows as they arrive ---------------
+    if outfile and not (return_table or show or sort_cols):
+        _out.write_rows(rows, outfile, word_cols)
+        log.info("Results saved to %s", outfile)
+        return None
 
-    table = _out.stack_tables(tables)
+    rows = list(rows)
+    table = _out.make_final_table(rows, word_cols)
 
     if sort_cols:
         sort_cols = [c for c in sort_cols if c in table.columns]
@@ -162,3 +240,31 @@ def search_pdfs(
 
     return table
 
+
+def _iter_rows(pdfs, words, workers, executor, ppdf, tqdm_desc, kwargs):
+    """Yield the result row of every PDF in *pdfs* order (serial or parallel)."""
+    # Parallel branch --------------------------------------------------
+    if workers > 1:
+        if executor == "thread":
+            pool = cf.ThreadPoolExecutor(max_workers=workers)
+        else:
+            pool = cf.ProcessPoolExecutor(max_workers=workers)
+        run = partial(search_pdf, words=words, **kwargs)
+        chunksize = max(1, len(pdfs) // (workers * 4))
+        with pool as ex, tqdm(
+            total=len(pdfs), desc=tqdm_desc, unit="pdf", ascii=True
+        ) as bar:
+            for row in ex.map(run, pdfs, chunksize=chunksize):
+                bar.update(1)
+                yield row
+    # Serial branch ----------------------------------------------------
+    else:
+        if ppdf:
+            stride = max(1, math.ceil(len(pdfs) / ppdf))
+            for i, pdf in enumerate(pdfs, 1):
+                if (i - 1) % stride == 0:
+                    log.info("%02d/%02d [%s]", i, len(pdfs), Path(pdf).name)
+                yield search_pdf(pdf, words, **kwargs)
+        else:
+            for pdf in tqdm(pdfs, desc=tqdm_desc, unit="pdf", ascii=True):
+                yield search_pdf(pdf, words, **kwargs)
@@ -5,25 +5,141 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Dict, Iterable, List, Optional, Sequence
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
 
+try:
+    import ahocorasick
 
+    HAS_AHOCORASICK = True
+except ImportError:  # pragma: no cover
+    HAS_AHOCORASICK = False  # pyahocorasick is optional
+
+try:
+    import hyperscan
+
+    HAS_HYPERSCAN = True
+except ImportError:  # pragma: no cover
+    HAS_HYPERSCAN = False  # hyperscan is optional
+
+_YEAR_RE = re.compile(r"\d{4}")
+_RANGE_RE = re.compile(r"^([+-]?\d+)\s*(?:-\s*([+-]?\d+))?$")  # "3", "-1", "3 - 5", "-3--1"
+_REGEX_META = re.compile(r"[.^$*+?{}()\[\]|\\]")
+_AUTOMATON_MIN_WORDS = 16  # below this, repeated str.count is faster
+_PAGE_SEP = "\x1e"  # ASCII record separator between pages of a joined document
+
+
+@lru_cache(maxsize=4096)  # bounded: long-lived library processes see many names
 def find_year(fname: str, default: str | None = None) -> str | None:
     """Return the first 4-digit number found in *fname* (commonly a year)."""
-    m = re.findall(r"\d{4}", os.path.basename(fname))
-    return m[0] if m else default
-
+    m = _YEAR_RE.search(os.path.basename(fname))
+    return m.group() if m else default
 
-def dict_to_lists(d: Dict[str, Iterable]) -> Dict[str, List]:
-    """Ensure every value is a *list* to satisfy Astropy / pandas constructors."""
-    return {k: list(v if isinstance(v, (list, tuple)) else [v]) for k, v in d.items()}
 
+def is_literal(word: str) -> bool:
+    """Return ``True`` when *word* contains no regex metacharacters."""
+    return not _REGEX_META.search(word)
 
-def compile_words(words: Sequence[str], flags: int):
-    """Pre-compile regex patterns for faster repeated use."""
-    import re
 
-    return {w: re.compile(w, flags=flags) for w in words}
+def compile_words(
+    words: Sequence[str], flags: int, unicode_form: str | None = None, literal: bool = False
+) -> Callable[[Sequence[str], List[int]], None]:
+    """
+    Pre-compile *words* and return ``count(texts, counts)``.
+
+    ``count`` adds the matches in the page *texts* of the i-th distinct word
+    (in order of first appearance in *words*) to ``counts[i]``, so callers can
+    keep one preallocated list of totals instead of hashing words per page.
+    Literal words are counted in one pass over the pages joined by a record
+    separator they cannot match; regular expressions are run page by page, so
+    that patterns such as ``foo.bar`` never match across a page break.
+
+    Words without regex metacharacters (every word when *literal* is true) are
+    counted with :pymeth:`str.count`, a C substring search far cheaper than
+    ``re``. Case-insensitive matching only takes that path for ASCII words on
+    ASCII pages, where lower-casing both sides agrees exactly with
+    ``re.IGNORECASE``; other pages (ligatures such as ``'\ufb01'``, ``'ß'``,
+    ``'\u212a'``) and non-ASCII words are matched with the escaped word as a
+    regular expression instead. With many literal words a single automaton
+    finds them all in one pass: a compiled *hyperscan* database when
+    installed, otherwise a *pyahocorasick* automaton (both count non-overlapping
+    matches, like :pymeth:`str.count`). The remaining words are compiled as
+    regular expressions.
+
+    With *unicode_form* the words are normalised before compiling, so the PDF
+    text does not have to be as long as every normalised word is ASCII.
+    """
+    ignore_case = bool(flags & re.IGNORECASE)
+    patterns = [unicodedata.normalize(unicode_form, w) if unicode_form else w
+                for w in dict.fromkeys(words)]
+    plain = [literal or is_literal(pat) for pat in patterns]
+    fast = [plain[i] and (not ignore_case or pat.isascii()) for i, pat in enumerate(patterns)]
+    literals = [(i, pat.lower() if ignore_case else pat)
+                for i, pat in enumerate(patterns) if fast[i]]
+    regexes = [(i, re.compile(re.escape(pat) if plain[i] else pat, flags=flags))
+               for i, pat in enumerate(patterns) if not fast[i]]
+    # Fast-path words on non-ASCII pages, where lower() and re.IGNORECASE differ
+    fallback = [(i, re.compile(re.escape(pat), flags=flags))
+                for i, pat in enumerate(patterns) if fast[i]] if ignore_case else []
+
+    database = automaton = None
+    subs = {sub: j for j, sub in enumerate(dict.fromkeys(sub for _, sub in literals))}
+    slots = [(i, subs[sub]) for i, sub in literals]
+    if len(subs) >= _AUTOMATON_MIN_WORDS and "" not in subs:
+        if HAS_HYPERSCAN:
+            # Hyperscan works on bytes: scan UTF-8 and track byte offsets
+            database = hyperscan.Database()
+            database.compile(expressions=[re.escape(sub).encode("utf-8", "surrogatepass")
+                                          for sub in subs],
+                             ids=list(subs.values()), elements=len(subs),
+                             flags=[0] * len(subs))
+            sizes = [len(sub.encode("utf-8", "surrogatepass")) for sub in subs]
+        elif HAS_AHOCORASICK:
+            automaton = ahocorasick.Automaton()
+            for sub, j in subs.items():
+                automaton.add_word(sub, (j, len(sub)))
+            automaton.make_automaton()
+
+    def count(texts: Sequence[str], counts: List[int]) -> None:
+        fast_texts = texts
+        if literals and ignore_case and not all(text.isascii() for text in texts):
+            for text in texts:
+                if not text.isascii():
+                    for i, pat in fallback:
+                        counts[i] += len(pat.findall(text))
+            fast_texts = [text for text in texts if text.isascii()]
+        if literals and fast_texts:
+            text = fast_texts[0] if len(fast_texts) == 1 else _PAGE_SEP.join(fast_texts)
+            hay = text.lower() if ignore_case else text
+            if database is not None:
+                hits = [0] * len(subs)
+                last = [0] * len(subs)  # end (exclusive) of the previous counted match
+
+                def on_match(j: int, start: int, end: int, flags: int, context) -> None:
+                    if end - sizes[j] >= last[j]:
+                        hits[j] += 1
+                        last[j] = end
+
+                database.scan(hay.encode("utf-8", "surrogatepass"), match_event_handler=on_match)
+                for i, j in slots:
+                    counts[i] += hits[j]
+            elif automaton is not None:
+                hits = [0] * len(subs)
+                last = [-1] * len(subs)  # end of the previous counted match
+                for end, (j, n) in automaton.iter(hay):
+                    if end - n >= last[j]:
+                        hits[j] += 1
+                        last[j] = end
+                for i, j in slots:
+                    counts[i] += hits[j]
+            else:
+                for i, sub in literals:
+                    counts[i] += hay.count(sub)
+        for i, pat in regexes:
+            counts[i] += sum(len(pat.findall(text)) for text in texts)
+
+    return count
 
 
 def apply_separators(fname: str, mapping: Dict[str, Dict[str, int]]) -> Dict[str, str]:
@@ -47,7 +163,9 @@ def apply_separators(fname: str, mapping: Dict[str, Dict[str, int]]) -> Dict[str
 
 def parse_page_range(spec: str | None) -> Optional[List[int]]:
     """
-    Turn ``"1,3-5,-1"`` into a list of page indices (0-based, negatives allowed).
+    Turn ``"1,3-5,-1"`` into a sorted list of unique page indices (0-based,
+    negatives allowed), so overlapping ranges such as ``"1-100,50-75"`` do not
+    extract a page twice.
 
     Returns ``None`` for an empty / ``None`` spec.
     """
@@ -59,10 +177,13 @@ def parse_page_range(spec: str | None) -> Optional[List[int]]:
         part = part.strip()
         if not part:
             continue
-        if "-" in part:
-            start, end = map(int, part.split("-"))
-            pages.extend(range(start, end + 1))
+        m = _RANGE_RE.match(part)
+        if m is None:
+            raise ValueError(f"Invalid page range: {part!r}")
+        start, end = m.groups()
+        if end is None:
+            pages.append(int(start))
         else:
-            pages.append(int(part))
-    return pages
+            pages.extend(range(int(start), int(end) + 1))
+    return sorted(set(pages))
 